@@ -19,22 +19,98 @@ function getContentType(filename) {
       return 'application/octet-stream';
   }
 }
+// Case-insensitive ordering by file name
+function compareNames(a, b) {
+  const nameA = a.name.toLowerCase();
+  const nameB = b.name.toLowerCase();
+  return nameA < nameB ? -1 : nameA > nameB ? 1 : 0;
+}
+// List the files stored in bucket 'files'
+// sort: "name" orders the result case-insensitively by name
+async function listFiles(supabase, sort) {
+  const { data: files, error } = await supabase.storage.from("files").list();
+  if (files && sort === "name") {
+    files.sort(compareNames);
+  }
+  return {
+    files: files || [],
+    error
+  };
+}
+// Upload bytes as a file to bucket 'files' and build the JSON response
+async function uploadFile(supabase, filename, bytes, returnList, sort) {
+  // Choose filename—either provided or generate one
+  const fileName = filename && typeof filename === "string" ? filename : `file_${Date.now()}.bin`;
+  // Detect content type from filename
+  const contentType = getContentType(fileName);
+  // Use the raw bytes for binary files (PDF, ZIP) instead of converting to text
+  const { data, error } = await supabase.storage.from("files").upload(fileName, new Blob([
+    bytes
+  ], {
+    type: contentType
+  }), {
+    upsert: true,
+    contentType: contentType
+  });
+  if (error) {
+    console.error("Upload error:", error);
+    return new Response(`❌ Failed to save file: ${error.message}`, {
+      status: 500
+    });
+  }
+  // Get public URL (if bucket is public) or signed URL
+  const { data: urlData } = supabase.storage.from("files").getPublicUrl(fileName);
+  const result = {
+    message: "File uploaded successfully",
+    filename: fileName,
+    path: data?.path,
+    contentType: contentType,
+    size: bytes.byteLength,
+    publicUrl: urlData?.publicUrl
+  };
+  // Piggyback the refreshed listing so the client can skip a separate list round trip
+  if (returnList) {
+    const { files, error: listError } = await listFiles(supabase, sort);
+    if (listError) {
+      console.error("List error:", listError);
+    } else {
+      result.count = files.length;
+      result.files = files;
+    }
+  }
+  return new Response(JSON.stringify(result), {
+    status: 200,
+    headers: {
+      "Content-Type": "application/json"
+    }
+  });
+}
 Deno.serve(async (req)=>{
-  // Only accept POST & JSON
-  if (req.method !== "POST" || req.headers.get("content-type") !== "application/json") {
-    return new Response("❌ Expected POST with JSON", {
+  const requestType = req.headers.get("content-type") || "";
+  const isRawUpload = requestType === "application/octet-stream";
+  // Only accept POST with JSON or a raw octet-stream body (file upload)
+  if (req.method !== "POST" || requestType !== "application/json" && !isRawUpload) {
+    return new Response("❌ Expected POST with JSON or application/octet-stream", {
       status: 400
     });
   }
   try {
-    const body = await req.json();
-    // Create Supabase client (needed for both operations)
+    // Create Supabase client (needed for all operations)
     const supabaseUrl = Deno.env.get("SUPABASE_URL");
     const supabaseKey = Deno.env.get("SUPABASE_SERVICE_ROLE_KEY");
     const supabase = createClient(supabaseUrl, supabaseKey);
+    // Raw upload: the body is the file itself, options come from the query string
+    if (isRawUpload) {
+      const params = new URL(req.url).searchParams;
+      // Compressible uploads arrive gzip-encoded; inflate them before storing
+      const body = req.headers.get("content-encoding") === "gzip" ? new Response(req.body.pipeThrough(new DecompressionStream("gzip"))) : req;
+      const bytes = new Uint8Array(await body.arrayBuffer());
+      return await uploadFile(supabase, params.get("filename"), bytes, params.get("return_list") === "true", params.get("sort"));
+    }
+    const body = await req.json();
     // Check if this is a list command
     if (body.cmd === "list") {
-      const { data: files, error } = await supabase.storage.from("files").list();
+      const { files, error } = await listFiles(supabase, body.sort);
       if (error) {
         console.error("List error:", error);
         return new Response(`❌ Failed to list files: ${error.message}`, {
@@ -43,8 +119,8 @@ Deno.serve(async (req)=>{
       }
       return new Response(JSON.stringify({
         message: "Files listed successfully",
-        count: files?.length || 0,
-        files: files || []
+        count: files.length,
+        files
       }), {
         status: 200,
         headers: {
@@ -80,8 +156,8 @@ Deno.serve(async (req)=>{
         }
       });
     }
-    // Otherwise, proceed with file upload
-    const { input, filename } = body;
+    // Otherwise, proceed with base64 JSON file upload
+    const { input, filename, return_list, sort } = body;
     if (typeof input !== "string") {
       return new Response("❌ 'input' must be a string (base64 encoded)", {
         status: 400
@@ -96,41 +172,7 @@ Deno.serve(async (req)=>{
         status: 400
       });
     }
-    // Choose filename—either provided or generate one
-    const fileName = filename && typeof filename === "string" ? filename : `file_${Date.now()}.bin`;
-    // Detect content type from filename
-    const contentType = getContentType(fileName);
-    // Upload decoded bytes as a file to bucket 'files'
-    // Use the raw bytes for binary files (PDF, ZIP) instead of converting to text
-    const { data, error } = await supabase.storage.from("files").upload(fileName, new Blob([
-      decodedBytes
-    ], {
-      type: contentType
-    }), {
-      upsert: true,
-      contentType: contentType
-    });
-    if (error) {
-      console.error("Upload error:", error);
-      return new Response(`❌ Failed to save file: ${error.message}`, {
-        status: 500
-      });
-    }
-    // Get public URL (if bucket is public) or signed URL
-    const { data: urlData } = supabase.storage.from("files").getPublicUrl(fileName);
-    return new Response(JSON.stringify({
-      message: "File uploaded successfully",
-      filename: fileName,
-      path: data?.path,
-      contentType: contentType,
-      size: decodedBytes.length,
-      publicUrl: urlData?.publicUrl
-    }), {
-      status: 200,
-      headers: {
-        "Content-Type": "application/json"
-      }
-    });
+    return await uploadFile(supabase, filename, decodedBytes, return_list === true, sort);
   } catch (err) {
     console.error("Error:", err);
     return new Response(`❌ Bad Request: ${err instanceof Error ? err.message : 'Unknown error'}`, {
@@ -1,13 +1,23 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-import base64
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import json
-from datetime import datetime
+import time
+import zlib
 from pathlib import Path
-from typing import NamedTuple, List, Dict, Any, Optional
+from typing import NamedTuple, List, Dict, Any, Optional, Callable, BinaryIO, Iterator
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
+try:
+    # orjson parses the raw response bytes directly and is several times faster than json
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -31,48 +41,152 @@ selected_file: Optional[Path] = None
 SUPA_UNPACK_API_URL: Optional[str] = None
 SUPA_MAIN_API_URL: Optional[str] = None
 
+# File chooser defaults
+DEFAULT_FOLDER = str(Path.home() / "Documents")
+FILE_TYPES = (("All Files", "*.*"), ("PDF Files", "*.pdf"), ("ZIP Files", "*.zip"))
+
+# Shared HTTP session so consecutive API calls reuse the same keep-alive TLS connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+# Worker pool for network I/O; results are handed back to the Tk thread via root.after()
+EXECUTOR = ThreadPoolExecutor(max_workers=4)
+# Set once root.mainloop() returns; results finishing after that are discarded
+_main_loop_exited = False
+
+# Tcl procedure that appends a list of value rows to a Treeview in a single call
+TCL_INSERT_ROWS_PROC = "files_manager_insert_rows"
+TCL_INSERT_ROWS_SCRIPT = (
+    f"proc {TCL_INSERT_ROWS_PROC} {{tree rows}} "
+    "{ foreach row $rows { $tree insert {} end -values $row } }"
+)
+
+# Upload read buffer; the HTTP layer reads in small blocks, served from this buffer
+UPLOAD_BUFFER_SIZE = 1 << 20
+# Fast gzip level for upload bodies; most of the gain at a fraction of the CPU of level 6+
+UPLOAD_COMPRESSION_LEVEL = 3
+# Leading bytes of already-compressed formats, which are uploaded as-is
+COMPRESSED_MAGIC_NUMBERS = (
+    b"PK\x03\x04",          # ZIP (also docx/xlsx/jar/...)
+    b"%PDF-",               # PDF
+    b"\x1f\x8b",            # gzip
+    b"\x28\xb5\x2f\xfd",    # zstd
+    b"\xfd7zXZ\x00",        # xz
+    b"BZh",                 # bzip2
+    b"7z\xbc\xaf\x27\x1c",  # 7-Zip
+    b"Rar!\x1a\x07",        # RAR
+    b"\x89PNG",             # PNG
+    b"\xff\xd8\xff",        # JPEG
+)
+MAGIC_NUMBER_LENGTH = max(len(magic) for magic in COMPRESSED_MAGIC_NUMBERS)
+# Download write size
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 # Declare log_text_area globally but initialize it to None
 # It will be assigned the actual widget later in main()
 log_text_area: Optional[tk.Text] = None
 
+# Pending log lines not yet written to log_text_area, flushed after LOG_FLUSH_DELAY_MS
+_log_buffer: List[str] = []
+LOG_FLUSH_DELAY_MS = 50
+
+# Listing requests (list or submit) are numbered as they start; a response older than the
+# last listing rendered is dropped so a slow reply cannot overwrite newer tree contents
+_listing_requests = 0
+_rendered_listing = 0
+
+# Last formatted log timestamp and the epoch second it was formatted for
+_last_log_second = -1
+_last_log_timestamp = ""
+
 
 # --- Helper Functions ---
+def _timestamp() -> str:
+    """Returns the current local time for log lines, formatting it at most once per second."""
+    global _last_log_second, _last_log_timestamp
+    now = int(time.time())
+    if now != _last_log_second:
+        _last_log_second = now
+        _last_log_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+    return _last_log_timestamp
+
+
 def add_log(message: str) -> None:
     """Function to add a log message to the log text area."""
+    line = f"[{_timestamp()}] {message}\n"
     # Check if log_text_area has been initialized before using it
     if log_text_area:
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_text_area.insert(tk.END, f"[{current_time}] {message}\n")
-        log_text_area.see(tk.END)
+        # Buffer lines and write them to the widget in one insert shortly afterwards
+        if not _log_buffer:
+            log_text_area.after(LOG_FLUSH_DELAY_MS, _flush_log_buffer)
+        _log_buffer.append(line)
     else:
         # Fallback if log_text_area isn't ready (e.g., during early config loading)
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+        print(line, end="")
+
+
+def _flush_log_buffer() -> None:
+    """Writes all buffered log lines to the log text area."""
+    log_text_area.insert(tk.END, "".join(_log_buffer))
+    log_text_area.see(tk.END)
+    _log_buffer.clear()
+
+
+def _gzip_chunks(file: BinaryIO) -> Iterator[bytes]:
+    """Yields the gzip-compressed contents of file, compressing it as it is read."""
+    compressor = zlib.compressobj(UPLOAD_COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    while True:
+        chunk = file.read(UPLOAD_BUFFER_SIZE)
+        if not chunk:
+            break
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def report_error(title: str, message: str, log_message: Optional[str] = None) -> None:
+    """Logs an error (log_message if given, else message) and shows it in an error dialog."""
+    add_log(message if log_message is None else log_message)
+    messagebox.showerror(title, message)
 
 
-def get_env_variable(var_name: str, error_message: str) -> Optional[str]:
-    """Retrieves an environment variable and shows an error if not found."""
-    value = os.getenv(var_name)
-    if not value:
-        add_log(error_message) # This add_log call is the problem area
-        messagebox.showerror("Configuration Error", error_message)
-        return None
-    return value
+def report_info(title: str, message: str, log_message: Optional[str] = None) -> None:
+    """Logs a message (log_message if given, else message) and shows it in an info dialog."""
+    add_log(message if log_message is None else log_message)
+    messagebox.showinfo(title, message)
 
 
-def get_auth_token() -> Optional[str]:
-    """Retrieves the authorization token from environment variables."""
-    return get_env_variable("SUPA_AUTH_TOKEN", "Error: Authorization token not found in environment variables!")
+def _next_listing() -> int:
+    """Returns the sequence number for a listing request that is about to start."""
+    global _listing_requests
+    _listing_requests += 1
+    return _listing_requests
+
+
+def _run_in_background(task: Callable[[], Any], on_done: Callable[[Future], None]) -> None:
+    """Runs task on the worker pool and calls on_done with its future on the Tk thread."""
+    def hand_back(fut: Future) -> None:
+        # After the window closes there is no Tk thread left to deliver the result to
+        if not _main_loop_exited:
+            root.after(0, on_done, fut)
+
+    future = EXECUTOR.submit(task)
+    future.add_done_callback(hand_back)
 
 
 # --- Core Logic Functions (unchanged, as the issue is in GUI setup order) ---
 def choose_file() -> None:
     global selected_file
-    default_folder = Path.home() / "Documents"
 
     file_path_str: str = filedialog.askopenfilename(
-        initialdir=str(default_folder),
+        initialdir=DEFAULT_FOLDER,
         title="Select a File",
-        filetypes=(("All Files", "*.*"), ("PDF Files", "*.pdf"), ("ZIP Files", "*.zip"))
+        filetypes=FILE_TYPES
     )
     if file_path_str:
         selected_file = Path(file_path_str)
@@ -86,116 +200,152 @@ def choose_file() -> None:
 
 def submit_file() -> None:
     if not selected_file:
-        messagebox.showerror("Error", "No file selected!")
-        add_log("Error: No file selected!")
+        report_error("Error", "No file selected!", "Error: No file selected!")
         return
 
     if SUPA_UNPACK_API_URL is None:
-        messagebox.showerror("Configuration Error", "API URL not configured. Please set SUPA_UNPACK_API_URL.")
-        add_log("Error: SUPA_UNPACK_API_URL is not set.")
+        report_error(
+            "Configuration Error",
+            "API URL not configured. Please set SUPA_UNPACK_API_URL.",
+            "Error: SUPA_UNPACK_API_URL is not set."
+        )
         return
 
-    try:
-        add_log(f"Preparing to submit file: {selected_file.name}...")
+    add_log(f"Preparing to submit file: {selected_file.name}...")
+
+    _run_in_background(partial(_do_submit, selected_file), partial(_apply_submit_result, listing=_next_listing()))
 
-        with selected_file.open("rb") as file:
-            file_content = file.read()
 
-        encoded_file = base64.b64encode(file_content).decode('utf-8')
-        filename = selected_file.name
+def _do_submit(path: Path) -> requests.Response:
+    """Uploads a file to the unpack API. Runs on a worker thread."""
+    params: Dict[str, str] = {
+        "filename": path.name,
+        "return_list": "true",
+        "sort": "name"
+    }
+    headers: Dict[str, str] = {"Content-Type": "application/octet-stream"}
+    with path.open("rb", buffering=UPLOAD_BUFFER_SIZE) as file:
+        if hasattr(os, "posix_fadvise"):
+            # Read once, front to back: let the kernel read ahead aggressively
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
 
-        auth_token = get_auth_token()
-        if not auth_token:
-            return
+        if file.peek(MAGIC_NUMBER_LENGTH).startswith(COMPRESSED_MAGIC_NUMBERS):
+            # Send the file itself as the request body: requests takes Content-Length from
+            # os.fstat and streams it in blocks, so it is never loaded into memory
+            body: Any = file
+        else:
+            body = _gzip_chunks(file)
+            headers["Content-Encoding"] = "gzip"
 
-        headers: Dict[str, str] = {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json"
-        }
+        return SESSION.post(SUPA_UNPACK_API_URL, params=params, data=body, headers=headers, timeout=30)
 
-        data: Dict[str, str] = {
-            "input": encoded_file,
-            "filename": filename
-        }
 
-        response = requests.post(SUPA_UNPACK_API_URL, headers=headers, json=data, timeout=30)
+def _apply_submit_result(future: Future, listing: int) -> None:
+    """Reports the outcome of _do_submit. Runs on the Tk thread."""
+    try:
+        response = future.result()
 
         if response.status_code == 200:
-            add_log("File submitted successfully!")
-            add_log(f"Response: {response.text}")
-            messagebox.showinfo("Success", "File submitted successfully!")
-            list_files()
+            report_info("Success", "File submitted successfully!")
+            # The file is stored at this point; the listing piggybacked on the response is a bonus
+            try:
+                response_data: Dict[str, Any] = json_loads(response.content)
+            except json.JSONDecodeError:
+                add_log(f"Response: {response.text}")
+                list_files()
+                return
+            # Keep the refreshed listing out of the log line
+            upload_info = {k: v for k, v in response_data.items() if k not in ('files', 'count')}
+            add_log(f"Response: {upload_info}")
+            # A newer listing may have been rendered while the upload ran, possibly taken before
+            # this file was stored; refresh again rather than leave the upload out of view
+            if 'files' not in response_data or not _render_files(response_data, listing):
+                list_files()
         else:
             error_message = f"Failed to submit file:\nStatus Code: {response.status_code}\nResponse: {response.text}"
-            add_log(error_message)
-            messagebox.showerror("Error", error_message)
+            report_error("Error", error_message)
     except requests.exceptions.RequestException as req_e:
         error_message = f"Network or API error during submission: {req_e}"
-        add_log(error_message)
-        messagebox.showerror("Network Error", error_message)
+        report_error("Network Error", error_message)
     except Exception as e:
         error_message = f"An unexpected error occurred during file submission: {e}"
-        add_log(error_message)
-        messagebox.showerror("Error", error_message)
+        report_error("Error", error_message)
+
+
+def _render_files(response_data: Dict[str, Any], listing: int) -> bool:
+    """Replaces the contents of the file tree with the files in an API response.
+
+    listing is the _next_listing() number of the request that produced the response;
+    responses older than the last one rendered are ignored. Returns whether the tree was updated.
+    """
+    global _rendered_listing
+    if listing < _rendered_listing:
+        add_log("Ignoring an outdated file listing.")
+        return False
+    _rendered_listing = listing
+
+    # Clear the tree with a single Tcl call rather than one per row
+    file_tree.delete(*file_tree.get_children())
+
+    # The API returns the files already sorted by name (see the "sort" request option)
+    files_to_display: List[Dict[str, Any]] = response_data.get('files', [])
+
+    rows: List[tuple] = []
+    append_row = rows.append  # bound once instead of looked up per row
+    for file_item in files_to_display:
+        # Folders are listed with "metadata": null
+        metadata = file_item.get('metadata') or {}
+        append_row((file_item.get('name', 'N/A'), metadata.get('size', 0), metadata.get('lastModified', 'N/A')))
+
+    # Insert every row with one Python -> Tcl call; tkinter quotes the nested tuples as Tcl lists
+    file_tree.tk.call(TCL_INSERT_ROWS_PROC, str(file_tree), tuple(rows))
+
+    add_log(f"Retrieved {response_data.get('count', 0)} files.")
+    return True
 
 
 def list_files() -> None:
     if SUPA_UNPACK_API_URL is None:
-        messagebox.showerror("Configuration Error", "API URL not configured. Please set SUPA_UNPACK_API_URL.")
-        add_log("Error: SUPA_UNPACK_API_URL is not set.")
+        report_error(
+            "Configuration Error",
+            "API URL not configured. Please set SUPA_UNPACK_API_URL.",
+            "Error: SUPA_UNPACK_API_URL is not set."
+        )
         return
 
-    try:
-        add_log("Retrieving list of files...")
+    add_log("Retrieving list of files...")
+
+    _run_in_background(_do_list, partial(_apply_list_result, listing=_next_listing()))
 
-        auth_token = get_auth_token()
-        if not auth_token:
-            return
 
-        headers: Dict[str, str] = {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json"
-        }
+def _do_list() -> requests.Response:
+    """Requests the remote file listing. Runs on a worker thread."""
+    data: Dict[str, str] = {"cmd": "list", "sort": "name"}
+    return SESSION.post(SUPA_UNPACK_API_URL, json=data, timeout=30)
 
-        data: Dict[str, str] = {"cmd": "list"}
 
-        response = requests.post(SUPA_UNPACK_API_URL, headers=headers, json=data, timeout=30)
+def _apply_list_result(future: Future, listing: int) -> None:
+    """Reports the outcome of _do_list. Runs on the Tk thread."""
+    response: Optional[requests.Response] = None
+    try:
+        response = future.result()
 
         if response.status_code == 200:
-            response_data: Dict[str, Any] = response.json()
+            response_data: Dict[str, Any] = json_loads(response.content)
             add_log(response_data['message'])
-
-            for child in file_tree.get_children():
-                file_tree.delete(child)
-
-            files_to_display: List[Dict[str, Any]] = sorted(
-                response_data.get('files', []),
-                key=lambda f: f.get('name', '').lower()
-            )
-
-            for file_item in files_to_display:
-                file_name = file_item.get('name', 'N/A')
-                file_size = file_item.get('metadata', {}).get('size', 0)
-                last_modified = file_item.get('metadata', {}).get('lastModified', 'N/A')
-                file_tree.insert("", "end", values=(file_name, file_size, last_modified))
-
-            add_log(f"Retrieved {response_data.get('count', 0)} files.")
+            _render_files(response_data, listing)
         else:
             error_message = f"Failed to list files:\nStatus Code: {response.status_code}\nResponse: {response.text}"
-            add_log(error_message)
-            messagebox.showerror("Error", error_message)
+            report_error("Error", error_message)
     except requests.exceptions.RequestException as req_e:
         error_message = f"Network or API error during file listing: {req_e}"
-        add_log(error_message)
-        messagebox.showerror("Network Error", error_message)
+        report_error("Network Error", error_message)
     except json.JSONDecodeError:
         error_message = f"Failed to parse JSON response from API. Response: {response.text}"
-        add_log(error_message)
-        messagebox.showerror("API Error", "Invalid JSON response from server.")
+        report_error("API Error", "Invalid JSON response from server.", error_message)
     except Exception as e:
         error_message = f"An unexpected error occurred during file listing: {e}"
-        add_log(error_message)
-        messagebox.showerror("Error", error_message)
+        report_error("Error", error_message)
 
 
 def download_file(event: tk.Event) -> None:
@@ -211,65 +361,105 @@ def download_file(event: tk.Event) -> None:
         return
 
     if SUPA_MAIN_API_URL is None:
-        messagebox.showerror("Configuration Error", "API URL not configured. Please set SUPA_MAIN_API_URL.")
-        add_log("Error: SUPA_MAIN_API_URL is not set.")
+        report_error(
+            "Configuration Error",
+            "API URL not configured. Please set SUPA_MAIN_API_URL.",
+            "Error: SUPA_MAIN_API_URL is not set."
+        )
+        return
+
+    # Ask for the destination first so the worker can stream straight to disk
+    save_path_str: str = filedialog.asksaveasfilename(
+        initialfile=filename,
+        title="Save File",
+        defaultextension=".*",
+        filetypes=(("All Files", "*.*"),)
+    )
+    if not save_path_str:
+        add_log("Download cancelled.")
         return
+    save_path = Path(save_path_str)
 
     add_log(f"Downloading file: {filename}")
 
-    try:
-        auth_token = get_auth_token()
-        if not auth_token:
-            return
+    _run_in_background(
+        partial(_do_download, filename, save_path),
+        partial(_apply_download_result, filename=filename, save_path=save_path)
+    )
+
+
+def _do_download(filename: str, save_path: Path) -> requests.Response:
+    """Downloads a file from the main API into save_path. Runs on a worker thread."""
+    data: Dict[str, str] = {"download": filename}
 
-        headers: Dict[str, str] = {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json"
-        }
+    # Stream the body so large files are written to disk chunk by chunk instead of held in memory
+    with SESSION.post(SUPA_MAIN_API_URL, json=data, timeout=60, stream=True) as response:
+        if response.status_code == 200:
+            content_length = int(response.headers.get("Content-Length", 0))
+            # Write to a sibling temporary file and move it into place only once the whole body
+            # has arrived, so a failed transfer never truncates or corrupts an existing save_path
+            part_path = save_path.with_name(save_path.name + ".part")
+            try:
+                with part_path.open("wb") as file:
+                    # Reserve the final size up front so the filesystem can allocate it contiguously
+                    # (the length only matches what is written when the body is not content-encoded)
+                    preallocated = bool(content_length) and "Content-Encoding" not in response.headers \
+                        and hasattr(os, "posix_fallocate")
+                    if preallocated:
+                        os.posix_fallocate(file.fileno(), 0, content_length)
+                    received = 0
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        file.write(chunk)
+                        received += len(chunk)
+                    # A body that ends early would otherwise leave zero padding from the preallocation
+                    if preallocated and received != content_length:
+                        raise IOError(f"Incomplete download: received {received} of {content_length} bytes.")
+                    if hasattr(os, "posix_fadvise"):
+                        # One-shot download: start writeback and keep it out of the page cache
+                        file.flush()
+                        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                os.replace(part_path, save_path)
+            except BaseException:
+                # Drop the partial download; the error itself is reported by _apply_download_result
+                if part_path.exists():
+                    part_path.unlink()
+                raise
+        else:
+            # Load the (small) error body before the connection is released
+            response.content
+    return response
 
-        data: Dict[str, str] = {"download": filename}
 
-        response = requests.post(SUPA_MAIN_API_URL, headers=headers, json=data, timeout=60)
+def _apply_download_result(future: Future, filename: str, save_path: Path) -> None:
+    """Reports the outcome of _do_download. Runs on the Tk thread."""
+    try:
+        response = future.result()
 
         if response.status_code == 200:
-            file_content: bytes = response.content
-            save_path_str: str = filedialog.asksaveasfilename(
-                initialfile=filename,
-                title="Save File",
-                defaultextension=".*",
-                filetypes=(("All Files", "*.*"),)
+            report_info(
+                "Success",
+                f"File saved to {save_path}",
+                f"File '{filename}' downloaded and saved to {save_path}."
             )
-            if save_path_str:
-                save_path = Path(save_path_str)
-                with save_path.open("wb") as file:
-                    file.write(file_content)
-                add_log(f"File '{filename}' downloaded and saved to {save_path}.")
-                messagebox.showinfo("Success", f"File saved to {save_path}")
-            else:
-                add_log("Download cancelled.")
         elif response.status_code == 404:
             error_message = f"File '{filename}' not found on the server."
-            add_log(error_message)
-            messagebox.showerror("Error", error_message)
+            report_error("Error", error_message)
         else:
             error_message = f"Failed to download file:\nStatus Code: {response.status_code}\nResponse: {response.text}"
-            add_log(error_message)
-            messagebox.showerror("Error", error_message)
+            report_error("Error", error_message)
     except requests.exceptions.RequestException as req_e:
         error_message = f"Network or API error during download: {req_e}"
-        add_log(error_message)
-        messagebox.showerror("Network Error", error_message)
+        report_error("Network Error", error_message)
     except Exception as e:
         error_message = f"An unexpected error occurred during download: {e}"
-        add_log(error_message)
-        messagebox.showerror("Error", error_message)
+        report_error("Error", error_message)
 
 
 # --- GUI Initialization ---
 def main() -> None:
     """Main function to set up and run the Tkinter application."""
     global root, file_label, log_text_area, file_tree, selected_file # Add log_text_area to global list
-    global SUPA_UNPACK_API_URL, SUPA_MAIN_API_URL
+    global SUPA_UNPACK_API_URL, SUPA_MAIN_API_URL, _main_loop_exited
 
     root = tk.Tk()
     root.title("File Submitter")
@@ -302,10 +492,10 @@ def main() -> None:
     # The `messagebox.showerror` will still work without `log_text_area`.
 
     # --- Load Configuration from Environment Variables ---
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Loading environment variables...")
+    print(f"[{_timestamp()}] Loading environment variables...")
 
-    # We modify get_env_variable to initially print to console if log_text_area is not ready.
-    # The messagebox will always work.
+    # Configuration is read from the environment once, here, and treated as fixed for the app's lifetime.
+    # Early errors go to the console since log_text_area is not ready; the messagebox will always work.
     global SUPA_UNPACK_API_URL, SUPA_MAIN_API_URL
 
     # Define a local helper for initial config loading that prints to console instead of log_text_area
@@ -313,7 +503,7 @@ def main() -> None:
         value = os.getenv(var_name)
         if not value:
             # Use print for early errors, as log_text_area might not be fully ready
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {error_message} (via console)")
+            print(f"[{_timestamp()}] {error_message} (via console)")
             messagebox.showerror("Configuration Error", error_message)
             return None
         return value
@@ -339,6 +529,9 @@ def main() -> None:
         messagebox.showerror("Configuration Error", "Application URLs or Token not fully configured. Exiting.")
         sys.exit(1)
 
+    # The token is fixed for the lifetime of the app; attach it to every request once
+    SESSION.headers["Authorization"] = f"Bearer {auth_token_check}"
+
 
     # --- GUI Widgets (moved after config loading) ---
     # Now that critical config is loaded, we can confidently set up the GUI
@@ -404,6 +597,7 @@ def main() -> None:
     file_tree.configure(yscrollcommand=tree_scrollbar.set)
 
     file_tree.bind("<Double-1>", download_file)
+    file_tree.tk.eval(TCL_INSERT_ROWS_SCRIPT)
 
     root.columnconfigure(0, weight=1)
     root.columnconfigure(1, weight=1)
@@ -412,6 +606,10 @@ def main() -> None:
 
     root.mainloop()
 
+    # The window is gone: drop results that arrive from here on and cancel transfers not yet started
+    _main_loop_exited = True
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
 
 if __name__ == "__main__":
     main()